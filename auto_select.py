@@ -0,0 +1,347 @@
+import tkinter as tk
+import importlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+from sudoku_board import Board
+from pipeline import propagation_stage
+from Astar import a_star_sudoku
+from backtracking_fc_mrv import initialize_domains, sudoku
+
+# Dosya adında '-' olduğu için normal import kullanılamaz
+min_conflict_solve = importlib.import_module("gui-yeni-min-conflict").min_conflict_solve
+
+# -----------------------------------------------------------------------------
+# ÖZELLİK TABANLI OTOMATİK ÇÖZÜCÜ SEÇİMİ
+# -----------------------------------------------------------------------------
+# Bulmacanın ucuz özellikleri (aday sayısı histogramı, tek adaylı hücreler ve tek
+# yayılım geçişinden sonra kalan boş hücreler) hesaplanır ve yönlendirme tablosuna bakılarak
+# en hızlı olması beklenen motor + parametreler seçilir. Tablo, benchmark
+# sonuçlarından calibrate() ile üretilir ve routing_table.json'a yazılır.
+
+ROUTING_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "routing_table.json")
+
+# Yayılımdan sonra kalan boş hücre sayısı için kova sınırları
+REMAINING_EDGES = (0, 10, 20, 30, 40, 50, 81)
+
+# A* ilk boş hücreden genişleme yaptığından büyük aramalarda bellek patlar;
+# kalibrasyonda bu sınırın üstünde denenmez ve yönlendirmede de seçilmez.
+ASTAR_MAX_REMAINING = 20
+
+
+def _propagation_engine(board):
+    # Özellik hesabında yayılım zaten yapıldı; tahta çözüldüyse çözüm odur.
+    return board if board.is_solved() else None
+
+
+def _backtracking_engine(board):
+    return sudoku(board.copy())
+
+
+# Motor adı → tahtayı (yayılım uygulanmış) alıp çözüm ya da None döndüren fonksiyon
+ENGINES = {
+    "propagation": _propagation_engine,
+    "backtracking": _backtracking_engine,
+    "astar": a_star_sudoku,
+    "min_conflicts": min_conflict_solve,
+}
+
+# Kalibrasyonda yarıştırılan motor + parametre seçenekleri
+CANDIDATE_ROUTES = (
+    {"engine": "propagation", "params": {}},
+    {"engine": "backtracking", "params": {}},
+    {"engine": "astar", "params": {}},
+    {"engine": "min_conflicts", "params": {"max_iterations": 1000, "reinit_threshold": 50}},
+    {"engine": "min_conflicts", "params": {"max_iterations": 5000, "reinit_threshold": 100}},
+    {"engine": "min_conflicts", "params": {"max_iterations": 20000, "reinit_threshold": 200}},
+)
+
+DEFAULT_ROUTE = {"engine": "backtracking", "params": {}}
+
+
+def puzzle_features(board):
+    """Bulmacanın ucuz özelliklerini hesaplar.
+    (features, reduced) döndürür; reduced tek yayılım geçişi uygulanmış tahtadır
+    (çelişki varsa None) ve seçilen motor doğrudan bunun üzerinde çalışır, böylece
+    yayılım iki kez yapılmaz."""
+
+    board = Board(board)
+    histogram = [0] * 10                 # histogram[k] = k adaylı boş hücre sayısı
+    for domain in initialize_domains(board).values():
+        histogram[len(domain)] += 1
+    empty = board.empty
+
+    reduced = propagation_stage(board)
+    features = {
+        "histogram": histogram,
+        "singles": histogram[1],
+        "remaining": reduced.empty if reduced is not None else empty,
+    }
+    return features, reduced
+
+
+def route_key(features):
+    """Yönlendirme tablosundaki anahtar: kalan boş hücre kovası, ortalama aday
+    sayısına göre 'dar'/'geniş' sınıfı ve başlangıçta tek adaylı hücre olup
+    olmadığı (ör. 'r30-wide-singles')."""
+
+    remaining = features["remaining"]
+    bucket = next(edge for edge in REMAINING_EDGES if remaining <= edge)
+    hist = features["histogram"]
+    cells = sum(hist)
+    mean_candidates = sum(k * n for k, n in enumerate(hist)) / cells if cells else 0
+    width = "wide" if mean_candidates >= 4 else "narrow"
+    singles = "singles" if features["singles"] else "nosingles"
+    return "r%d-%s-%s" % (bucket, width, singles)
+
+
+def load_routing_table(path=ROUTING_TABLE_PATH):
+    """Yönlendirme tablosunu okur. Dosya yoksa ya da tablo farklı kova sınırlarıyla
+    (REMAINING_EDGES) uydurulmuşsa anahtarlar eşleşmeyeceğinden boş tablo döner
+    ve varsayılan motor kullanılır."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if tuple(data.get("remaining_edges", ())) != REMAINING_EDGES:
+        return {}
+    return data["routes"]
+
+
+def choose_route(features, table):
+    """Özelliklere göre motor ve parametreleri seçer.
+    Anahtar tabloda yoksa aynı sınıflardaki en yakın kova kullanılır. A* yalnızca
+    kalan boş hücre sayısı ASTAR_MAX_REMAINING'i aşmıyorsa seçilir."""
+
+    remaining = features["remaining"]
+    if remaining == 0:
+        return {"engine": "propagation", "params": {}}
+    key = route_key(features)
+    if key in table:
+        route = table[key]
+    else:
+        bucket, classes = key[1:].split("-", 1)
+        similar = [k for k in table if k.split("-", 1)[1] == classes]
+        if not similar:
+            return DEFAULT_ROUTE
+        nearest = min(similar, key=lambda k: abs(int(k[1:].split("-")[0]) - int(bucket)))
+        route = table[nearest]
+    if route["engine"] == "astar" and remaining > ASTAR_MAX_REMAINING:
+        return DEFAULT_ROUTE
+    return route
+
+
+def auto_solve(board, table=None):
+    """Otomatik modda çözer: özellikleri hesaplar, motoru seçer ve çalıştırır.
+    (çözüm ya da None, seçilen rota) döndürür."""
+
+    if table is None:
+        table = load_routing_table()
+    features, reduced = puzzle_features(board)
+    if reduced is None:
+        return None, {"engine": "propagation", "params": {}}   # Çelişki → erken dur
+    route = choose_route(features, table)
+    return ENGINES[route["engine"]](reduced, **route["params"]), route
+
+
+# -----------------------------------------------------------------------------
+# KALİBRASYON (BENCHMARK → YÖNLENDİRME TABLOSU)
+# -----------------------------------------------------------------------------
+
+def load_puzzles(path):
+    """Her satırda 81 karakterlik bir bulmaca ('0' ya da '.' → boş) içeren dosyayı okur."""
+    puzzles = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if len(line) == 81:
+                puzzles.append(Board([0 if ch in ".0" else int(ch) for ch in line]))
+    return puzzles
+
+
+def generate_puzzles(count, seed=0):
+    """Rastgele dönüştürülmüş çözülmüş bir tahtadan 45‑64 arası hücre silerek
+    kalibrasyon için bulmaca üretir (17‑36 ipucu; yayılımın tek başına çözemediği
+    zor tahtalar da dahil)."""
+
+    rng = random.Random(seed)
+    puzzles = []
+    for _ in range(count):
+        digits = list(range(1, 10))
+        rng.shuffle(digits)
+        rows = [3 * band + r for band in rng.sample(range(3), 3) for r in rng.sample(range(3), 3)]
+        cols = [3 * stack + c for stack in rng.sample(range(3), 3) for c in rng.sample(range(3), 3)]
+        board = Board([[digits[(3 * (r % 3) + r // 3 + c) % 9] for c in cols] for r in rows])
+        for i in rng.sample(range(81), rng.randint(45, 64)):
+            board.set(i // 9, i % 9, 0)
+        puzzles.append(board)
+    return puzzles
+
+
+def benchmark(puzzles, routes=CANDIDATE_ROUTES):
+    """Her bulmacada her aday rotayı çalıştırıp süreleri ölçer.
+    (features, {rota_adı: süre}) listesi döndürür; çözemeyen ya da uygun
+    görülmeyen rotanın süresi sonsuzdur."""
+
+    results = []
+    for board in puzzles:
+        start = time.perf_counter()
+        features, reduced = puzzle_features(board)
+        feature_time = time.perf_counter() - start
+        if reduced is None:
+            continue
+        times = {}
+        for route in routes:
+            name = route_name(route)
+            if route["engine"] == "astar" and features["remaining"] > ASTAR_MAX_REMAINING:
+                times[name] = float("inf")
+                continue
+            start = time.perf_counter()
+            solution = ENGINES[route["engine"]](reduced.copy(), **route["params"])
+            elapsed = time.perf_counter() - start
+            times[name] = feature_time + elapsed if solution is not None else float("inf")
+        results.append((features, times))
+    return results
+
+
+def route_name(route):
+    params = ",".join("%s=%s" % kv for kv in sorted(route["params"].items()))
+    return route["engine"] + ("(" + params + ")" if params else "")
+
+
+def fit_routing_table(results, routes=CANDIDATE_ROUTES):
+    """Her anahtar için medyan süresi en düşük rotayı seçer.
+    Yayılımın tamamen çözdüğü bulmacalar choose_route'ta doğrudan yönlendirildiği,
+    hiçbir rotanın çözemediği (çözümsüz) bulmacalar da rotalar hakkında bilgi
+    taşımadığı için tabloya girmez."""
+
+    by_key = defaultdict(lambda: defaultdict(list))
+    for features, times in results:
+        if features["remaining"] == 0 or all(t == float("inf") for t in times.values()):
+            continue
+        for name, elapsed in times.items():
+            by_key[route_key(features)][name].append(elapsed)
+
+    named = {route_name(route): route for route in routes}
+    table = {}
+    for key, per_route in sorted(by_key.items()):
+        best = min(per_route, key=lambda name: statistics.median(per_route[name]))
+        table[key] = named[best]
+    return table
+
+
+def evaluate(results, table):
+    """Otomatik seçimin toplam süresini, her bulmacada en hızlı motorun (kâhin)
+    ve tüm motorları sırayla yarıştırmanın toplam süresiyle karşılaştırır.
+    Seçilen rotanın çözemediği bulmacalar 'failed' olarak ayrıca sayılır;
+    hiçbir rotanın çözemediği bulmacalar 'unsolvable' olarak sayılıp atlanır."""
+
+    scores = {"auto": 0.0, "oracle": 0.0, "race": 0.0, "failed": 0, "unsolvable": 0}
+    for features, times in results:
+        finite = [t for t in times.values() if t != float("inf")]
+        if not finite:
+            scores["unsolvable"] += 1
+            continue
+        chosen = times.get(route_name(choose_route(features, table)), float("inf"))
+        if chosen == float("inf"):
+            scores["failed"] += 1
+        else:
+            scores["auto"] += chosen
+        scores["oracle"] += min(finite)
+        scores["race"] += sum(finite)
+    return scores
+
+
+def calibrate(puzzles, held_out, path=ROUTING_TABLE_PATH):
+    """puzzles üzerinde benchmark yapıp tabloyu yeniden uydurur ve tabloyu uydurmada
+    kullanılmayan held_out bulmacalarında değerlendirir. Tablo yalnızca seçilen
+    rota hiçbir ayrılmış bulmacada başarısız olmadıysa (failed == 0) path'e
+    kaydedilir. (tablo, skorlar, kaydedildi mi) döndürür."""
+
+    table = fit_routing_table(benchmark(puzzles))
+    scores = evaluate(benchmark(held_out), table)
+    if scores["failed"]:
+        return table, scores, False
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"remaining_edges": REMAINING_EDGES, "routes": table}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return table, scores, True
+
+
+if __name__ == "__main__":
+    # Kalibrasyon: python auto_select.py --calibrate [bulmacalar.txt]
+    if len(sys.argv) > 1 and sys.argv[1] == "--calibrate":
+        # Dosya verilirse her dördüncü bulmaca değerlendirme için ayrılır.
+        if len(sys.argv) > 2:
+            puzzles = load_puzzles(sys.argv[2])
+            train = [p for i, p in enumerate(puzzles) if i % 4 != 3]
+            held_out = [p for i, p in enumerate(puzzles) if i % 4 == 3]
+        else:
+            train, held_out = generate_puzzles(200, seed=0), generate_puzzles(100, seed=1)
+        table, scores, written = calibrate(train, held_out)
+        for key, route in table.items():
+            print("{:<24} → {}".format(key, route_name(route)))
+        print("Ayrılmış bulmacalarda toplam süre  otomatik: {auto:.4f}  en iyi: {oracle:.4f}  "
+              "yarış: {race:.4f} saniye  (seçilen motor çözemedi: {failed}, çözümsüz: {unsolvable})".format(**scores))
+        if not written:
+            print("Seçilen motor bazı bulmacaları çözemedi; " + ROUTING_TABLE_PATH + " güncellenmedi.")
+            sys.exit(1)
+        sys.exit(0)
+
+    # --- GUI Kısmı ---
+
+    # Örnek Sudoku tahtası (0: boş hücre)
+    initial_board = Board([
+        [8, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 3, 6, 0, 0, 0, 0, 0],
+        [0, 7, 0, 0, 9, 0, 2, 0, 0],
+        [0, 5, 0, 0, 0, 7, 0, 0, 0],
+        [0, 0, 0, 0, 4, 5, 7, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 3, 0],
+        [0, 0, 1, 0, 0, 0, 0, 6, 8],
+        [0, 0, 8, 5, 0, 0, 0, 1, 0],
+        [0, 9, 0, 0, 0, 0, 4, 0, 0]
+    ])
+
+    root = tk.Tk()
+    root.title("Sudoku - Otomatik Çözücü Seçimi")
+
+    # GUI'nin sağ üst köşesinde çalışma süresini göstermek için bir Label oluşturuyoruz.
+    time_label = tk.Label(root, text="Çalışma süresi: ", font=("Arial", 14))
+    time_label.pack(anchor="ne", padx=10, pady=5)
+
+    # Sudoku tahtasını göstermek için Text widget'ı oluşturuluyor.
+    text_display = tk.Text(root, width=40, height=20, font=("Courier", 14))
+    text_display.pack(pady=10)
+
+    # Başlangıçta, Sudoku'nun ilk hali Text widget'ında gösterilir.
+    text_display.insert(tk.END, "İlk Sudoku:\n" + initial_board.to_string())
+
+    def start_solver():
+        """
+        "Başlat" butonuna basıldığında çalışır.
+        Motor, bulmacanın özelliklerine göre yönlendirme tablosundan seçilir;
+        seçilen motor, sonuç ve çalışma süresi GUI'ye ve terminale yazdırılır.
+        """
+        text_display.delete("1.0", tk.END)
+        start_time = time.time()  # Başlat butonuna basıldığı anda zaman alınır.
+        solution, route = auto_solve(initial_board)
+        elapsed_time = time.time() - start_time  # Çözüm tamamlandığında geçen süre hesaplanır.
+        text_display.insert(tk.END, "Seçilen motor: " + route_name(route) + "\n")
+        if solution is not None:
+            text_display.insert(tk.END, "Çözülen Sudoku:\n" + solution.to_string())
+        else:
+            text_display.insert(tk.END, "Çözüm bulunamadı.")
+        time_label.config(text="Çalışma süresi: {:.4f} saniye".format(elapsed_time))
+        print("Çalışma süresi: {:.4f} saniye".format(elapsed_time))
+
+    # "Başlat" butonunu oluşturuyoruz.
+    start_button = tk.Button(root, text="Başlat", font=("Arial", 14), command=start_solver)
+    start_button.pack(pady=10)
+
+    root.mainloop()
@@ -1,35 +1,16 @@
 import tkinter as tk
-import numpy as np
-import copy
-from collections import deque
 import time  # Zaman ölçümü için kullanılıyor
 
-# --- Sudoku Çözüm Fonksiyonları (Backtracking + Forward Checking + MRV) ---
+from sudoku_board import Board, PEERS
 
-def is_valid(board, row, col, val):
-    # Verilen 'val'nun (değerin) board'da, 
-    # belirtilen satırda veya sütunda zaten bulunup bulunmadığını kontrol eder.
-    for i in range(9):
-        # Satır ve sütun kontrolü: Eğer 'val' bulunuyorsa, geçersiz atama yapılır.
-        if board[row][i] == val or board[i][col] == val:
-            return False
-    # 3x3 blok kontrolü: Hücrenin ait olduğu 3x3 bloğu belirleyip 'val'nun orada olup olmadığını kontrol eder.
-    start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-    for r in range(start_row, start_row + 3):
-        for c in range(start_col, start_col + 3):
-            if board[r][c] == val:
-                return False
-    # Tüm kontroller başarılıysa geçerli atamadır.
-    return True
+# --- Sudoku Çözüm Fonksiyonları (Backtracking + Forward Checking + MRV) ---
 
 def initialize_domains(board):
     # Boş (0 olan) hücrelerin her biri için, o hücrede hangi rakamların yer alabileceğini hesaplar.
     domains = {}
-    for row in range(9):
-        for col in range(9):
-            if board[row][col] == 0:
-                # is_valid fonksiyonu kullanılarak, 1-9 arası değerlerden hangileri uygun ise domain'e eklenir.
-                domains[(row, col)] = {num for num in range(1, 10) if is_valid(board, row, col, num)}
+    for row, col in board.empty_cells():
+        # Board'un önbellekteki satır/sütun/blok maskelerinden uygun değerler doğrudan okunur.
+        domains[(row, col)] = board.candidates(row, col)
     return domains
 
 def mrv(domains):
@@ -52,15 +33,15 @@ def forward_checking(board, domains, row, col, value):
 def backtracking(board, domains):
     # Temel rekürsif backtracking fonksiyonudur.
     # Eğer tüm hücreler doluysa (0 kalmamışsa), çözüm bulunmuştur.
-    if all(board[r][c] != 0 for r in range(9) for c in range(9)):
+    if board.empty == 0:
         return True
     # MRV kullanılarak, en az seçenekli (en kısıtlı) boş hücre seçilir.
     row, col = mrv(domains)
     # Seçilen hücrenin domainindeki rakamlar küçükten büyüğe sırayla denenir.
     for value in sorted(domains[(row, col)]):
         # Her bir deneme için, 'is_valid' ile geçerlilik kontrolü yapılır.
-        if is_valid(board, row, col, value):
-            board[row][col] = value  # Geçerli ise, değeri atar.
+        if board.is_valid(row, col, value):
+            board.set(row, col, value)  # Geçerli ise, değeri atar.
             # Domainleri kopyalayıp, atanan hücreyi domain listesinden çıkarır.
             new_domains = {k: v.copy() for k, v in domains.items()}
             del new_domains[(row, col)]
@@ -70,91 +51,188 @@ def backtracking(board, domains):
                 if backtracking(board, new_domains):
                     return True
             # Eğer atama işe yaramazsa, hücreyi sıfırlayarak geri alınır (backtrack).
-            board[row][col] = 0
+            board.set(row, col, 0)
     # Tüm değerler denendikten sonra hiçbir uygun atama bulunamazsa, False döner.
     return False
 
 def sudoku(board):
+    # board bir Board ya da 9x9 liste olabilir; liste Board'a çevrilir, Board ise yerinde (inplace) çözülür.
+    # Çözülen Board döndürülür; çözüm yoksa None döner.
+    if not isinstance(board, Board):
+        board = Board(board)
     # Sudoku çözümünü başlatmak için önce tüm boş hücreler için domainleri hesaplar.
     domains = initialize_domains(board)
     # Daha sonra backtracking fonksiyonuyla çözümü arar.
-    return backtracking(board, domains)
+    return board if backtracking(board, domains) else None
 
-def board_to_string(board):
+class IncrementalSolver:
     """
-    Sudoku tahtasını, satır satır string olarak oluşturur.
-    3x3 blok ayrımları çizgilerle belirginleştirilir.
-    Boş hücreler nokta (".") ile gösterilir.
+    Tek hücrelik ipucu düzenlemelerinden sonra Sudoku'yu sıfırdan başlamadan yeniden çözer.
+    İpucu tahtası, onun domainleri ve son çözüm saklanır. Bir düzenlemeden sonra:
+      1. Yalnızca düzenlenen hücrenin ve komşularının domainleri güncellenir.
+      2. Eski çözüm yeni ipucuyla hâlâ uyumluysa hiç arama yapılmaz.
+      3. Değilse, çözümde düzenlenen hücrenin komşularındaki (ipucu olmayan) değerler silinir
+         ve yalnızca bu hücreler için arama yapılır; çözümün geri kalanı korunur.
+      4. Bu da başarısız olursa, saklanan domainlerin kopyasıyla tam arama yapılır.
     """
-    lines = []
-    for i, row in enumerate(board):
-        if i % 3 == 0 and i != 0:
-            lines.append("-" * 21)  # Her 3 satırda bir ayrım çizgisi ekler.
-        line = ""
-        for j, val in enumerate(row):
-            if j % 3 == 0 and j != 0:
-                line += "| "  # Her 3 sütun sonrası dikey ayırıcı ekler.
-            cell = str(val) if val != 0 else "."
-            line += cell + " "
-        lines.append(line)
-    return "\n".join(lines)
-
-# --- GUI Kısmı (Tkinter) ---
-
-# Örnek Sudoku tahtası; 0, boş hücreleri temsil eder.
-initial_board = [
-    [5, 4, 0, 0, 2, 0, 8, 0, 6],
-        [0, 1, 9, 0, 0, 7, 0, 0, 3],
-        [0, 0, 0, 3, 0, 0, 2, 1, 0],
-        [9, 0, 0, 4, 0, 5, 0, 2, 0],
-        [0, 0, 1, 0, 0, 0, 6, 0, 4],
-        [6, 0, 4, 0, 3, 2, 0, 8, 0],
-        [0, 6, 0, 0, 0, 0, 1, 9, 0],
-        [4, 0, 2, 0, 0, 9, 0, 0, 5],
-        [0, 9, 0, 0, 7, 0, 4, 0, 2]
-]
-
-# Çözüm sırasında board'in dışarıya yansımaması için, orijinalinin kopyasını oluşturuyoruz.
-board_for_solving = copy.deepcopy(initial_board)
-
-# Tkinter GUI oluşturuluyor.
-root = tk.Tk()
-root.title("Sudoku Çözümü GUI")
-
-# Sağ üst köşede çalışma süresini göstermek için bir Label oluşturuluyor.
-time_label = tk.Label(root, text="Çalışma süresi: ", font=("Arial", 14))
-time_label.pack(anchor="ne", padx=10, pady=5)
-
-# Sudoku tahtasını göstermek için Text widget'ı oluşturuluyor.
-text_display = tk.Text(root, width=30, height=20, font=("Courier", 14))
-text_display.pack(pady=10)
-
-# Başlangıçta, Sudoku'nun ilk hali Text widget'ında gösterilir.
-text_display.insert(tk.END, "İlk Sudoku:\n")
-text_display.insert(tk.END, board_to_string(initial_board))
-
-def start_solver():
-    """
-    "Başlat" butonuna basıldığında çalışır.
-    1. Butona basıldığı anda (start_time) zaman damgası alınır.
-    2. sudoku() fonksiyonu board_for_solving üzerinde çalışarak çözümü üretir.
-    3. Çözüm tamamlandığında, geçen süre hesaplanır (elapsed_time).
-    4. Sonuç, ASCII formatında Text widget'ına yazdırılır.
-    5. Çalışma süresi hem terminale hem de GUI'nin sağ üstündeki time_label'a yazdırılır.
-    """
-    text_display.delete("1.0", tk.END)  # Önce ekrandaki metni temizler.
-    start_time = time.time()  # Başlat butonuna basıldığı anda zaman kaydı.
-    if sudoku(board_for_solving):  # sudoku() fonksiyonuyla çözüm üretilmeye çalışılır.
-        solved_text = "Çözülen Sudoku:\n" + board_to_string(board_for_solving)
-        text_display.insert(tk.END, solved_text)
-    else:
-        text_display.insert(tk.END, "Çözüm bulunamadı.")
-    elapsed_time = time.time() - start_time  # Çözüm tamamlandığında geçen süre hesaplanır.
-    time_label.config(text="Çalışma süresi: {:.4f} saniye".format(elapsed_time))
-    print("Çalışma süresi: {:.4f} saniye".format(elapsed_time))
-
-# "Başlat" butonunu oluşturuyoruz.
-start_button = tk.Button(root, text="Başlat", command=start_solver, font=("Arial", 14))
-start_button.pack(pady=10)
-
-root.mainloop()
+
+    def __init__(self, board):
+        self.clues = Board(board)  # Kullanıcının girdiği ipuçları (0 → boş hücre)
+        self.domains = initialize_domains(self.clues)
+        self.solution = None
+        self.searched = False  # En az bir kez çözüm arandı mı?
+
+    def solve(self):
+        # Daha önce çözüldüyse saklanan sonuç doğrudan döndürülür.
+        if not self.searched:
+            self.solution = self._full_search()
+            self.searched = True
+        return self.solution
+
+    def edit(self, row, col, num):
+        # <row>,<col> hücresindeki ipucunu num yapar (0 → ipucunu siler) ve yeni çözümü döndürür.
+        self.clues.set(row, col, num)
+        if num:
+            self.domains.pop((row, col), None)
+        else:
+            self.domains[(row, col)] = self.clues.candidates(row, col)
+        # Sadece etkilenen komşu hücrelerin domainleri yeniden hesaplanır.
+        for j in PEERS[9 * row + col]:
+            peer = divmod(j, 9)
+            if peer in self.domains:
+                self.domains[peer] = self.clues.candidates(*peer)
+
+        previous, self.solution = self.solution, None
+        self.searched = True
+        if not self.clues.is_consistent() or any(len(d) == 0 for d in self.domains.values()):
+            return None  # İpuçları çelişkili; arama yapmaya gerek yok.
+        if previous is not None and (num == 0 or previous.get(row, col) == num):
+            # Silinen ya da çözümle aynı değere sahip ipucu eski çözümü bozmaz.
+            self.solution = previous
+            return previous
+        if previous is not None:
+            self.solution = self._repair(previous, row, col, num)
+        if self.solution is None:
+            self.solution = self._full_search()
+        return self.solution
+
+    def _repair(self, previous, row, col, num):
+        # Eski çözümde yalnızca düzenlenen hücrenin komşularını boşaltıp yeniden doldurur.
+        board = previous.copy()
+        board.set(row, col, num)
+        cleared = [divmod(j, 9) for j in PEERS[9 * row + col] if self.clues.cells[j] == 0]
+        for r, c in cleared:
+            board.set(r, c, 0)
+        domains = {(r, c): board.candidates(r, c) for r, c in cleared}
+        if any(len(d) == 0 for d in domains.values()):
+            return None
+        return board if backtracking(board, domains) else None
+
+    def _full_search(self):
+        # Saklanan domainlerin kopyasıyla ipucu tahtasından tam arama yapar.
+        board = self.clues.copy()
+        domains = {k: v.copy() for k, v in self.domains.items()}
+        return board if backtracking(board, domains) else None
+
+if __name__ == "__main__":
+    # --- GUI Kısmı (Tkinter) ---
+
+    # Örnek Sudoku tahtası; 0, boş hücreleri temsil eder.
+    initial_board = Board([
+        [5, 4, 0, 0, 2, 0, 8, 0, 6],
+            [0, 1, 9, 0, 0, 7, 0, 0, 3],
+            [0, 0, 0, 3, 0, 0, 2, 1, 0],
+            [9, 0, 0, 4, 0, 5, 0, 2, 0],
+            [0, 0, 1, 0, 0, 0, 6, 0, 4],
+            [6, 0, 4, 0, 3, 2, 0, 8, 0],
+            [0, 6, 0, 0, 0, 0, 1, 9, 0],
+            [4, 0, 2, 0, 0, 9, 0, 0, 5],
+            [0, 9, 0, 0, 7, 0, 4, 0, 2]
+    ])
+
+    # Çözücü ipuçlarını, domainleri ve son çözümü saklar; böylece düzenlemelerden sonra
+    # arama sıfırdan başlamaz. initial_board'un kopyası üzerinde çalışır.
+    solver = IncrementalSolver(initial_board)
+
+    # Tkinter GUI oluşturuluyor.
+    root = tk.Tk()
+    root.title("Sudoku Çözümü GUI")
+
+    # Sağ üst köşede çalışma süresini göstermek için bir Label oluşturuluyor.
+    time_label = tk.Label(root, text="Çalışma süresi: ", font=("Arial", 14))
+    time_label.pack(anchor="ne", padx=10, pady=5)
+
+    # Sudoku tahtasını göstermek için Text widget'ı oluşturuluyor.
+    text_display = tk.Text(root, width=30, height=20, font=("Courier", 14))
+    text_display.pack(pady=10)
+
+    # Başlangıçta, Sudoku'nun ilk hali Text widget'ında gösterilir.
+    text_display.insert(tk.END, "İlk Sudoku:\n")
+    text_display.insert(tk.END, initial_board.to_string())
+
+    def start_solver():
+        """
+        "Başlat" butonuna basıldığında çalışır.
+        1. Butona basıldığı anda (start_time) zaman damgası alınır.
+        2. solver.solve() çözümü üretir (daha önce çözüldüyse saklanan çözüm kullanılır).
+        3. Çözüm tamamlandığında, geçen süre hesaplanır (elapsed_time).
+        4. Sonuç, ASCII formatında Text widget'ına yazdırılır.
+        5. Çalışma süresi hem terminale hem de GUI'nin sağ üstündeki time_label'a yazdırılır.
+        """
+        text_display.delete("1.0", tk.END)  # Önce ekrandaki metni temizler.
+        start_time = time.time()  # Başlat butonuna basıldığı anda zaman kaydı.
+        solution = solver.solve()  # Çözüm üretilmeye çalışılır.
+        if solution is not None:
+            solved_text = "Çözülen Sudoku:\n" + solution.to_string()
+            text_display.insert(tk.END, solved_text)
+        else:
+            text_display.insert(tk.END, "Çözüm bulunamadı.")
+        elapsed_time = time.time() - start_time  # Çözüm tamamlandığında geçen süre hesaplanır.
+        time_label.config(text="Çalışma süresi: {:.4f} saniye".format(elapsed_time))
+        print("Çalışma süresi: {:.4f} saniye".format(elapsed_time))
+
+    def apply_edit():
+        """
+        "Güncelle" butonuna basıldığında çalışır.
+        Girilen satır/sütun (1-9) hücresindeki ipucu, girilen değerle (0 → sil) değiştirilir
+        ve solver.edit() ile yalnızca etkilenen kısım yeniden çözülür.
+        """
+        text_display.delete("1.0", tk.END)
+        try:
+            row, col, num = int(row_entry.get()) - 1, int(col_entry.get()) - 1, int(value_entry.get())
+        except ValueError:
+            text_display.insert(tk.END, "Satır, sütun ve değer sayı olmalıdır.")
+            return
+        if not (0 <= row < 9 and 0 <= col < 9 and 0 <= num <= 9):
+            text_display.insert(tk.END, "Satır/sütun 1-9, değer 0-9 arasında olmalıdır.")
+            return
+        start_time = time.time()  # Güncelle butonuna basıldığı anda zaman kaydı.
+        solution = solver.edit(row, col, num)
+        elapsed_time = time.time() - start_time
+        if solution is not None:
+            text_display.insert(tk.END, "Güncellenen Sudoku:\n" + solution.to_string())
+        else:
+            text_display.insert(tk.END, "Çözüm bulunamadı.\n" + solver.clues.to_string())
+        time_label.config(text="Çalışma süresi: {:.4f} saniye".format(elapsed_time))
+        print("Çalışma süresi: {:.4f} saniye".format(elapsed_time))
+
+    # "Başlat" butonunu oluşturuyoruz.
+    start_button = tk.Button(root, text="Başlat", command=start_solver, font=("Arial", 14))
+    start_button.pack(pady=10)
+
+    # Tek hücre düzenleme alanı: satır, sütun, değer ve "Güncelle" butonu.
+    edit_frame = tk.Frame(root)
+    edit_frame.pack(pady=5)
+    tk.Label(edit_frame, text="Satır", font=("Arial", 12)).pack(side=tk.LEFT)
+    row_entry = tk.Entry(edit_frame, width=3, font=("Arial", 12))
+    row_entry.pack(side=tk.LEFT, padx=2)
+    tk.Label(edit_frame, text="Sütun", font=("Arial", 12)).pack(side=tk.LEFT)
+    col_entry = tk.Entry(edit_frame, width=3, font=("Arial", 12))
+    col_entry.pack(side=tk.LEFT, padx=2)
+    tk.Label(edit_frame, text="Değer", font=("Arial", 12)).pack(side=tk.LEFT)
+    value_entry = tk.Entry(edit_frame, width=3, font=("Arial", 12))
+    value_entry.pack(side=tk.LEFT, padx=2)
+    edit_button = tk.Button(edit_frame, text="Güncelle", command=apply_edit, font=("Arial", 12))
+    edit_button.pack(side=tk.LEFT, padx=5)
+
+    root.mainloop()
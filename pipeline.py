@@ -0,0 +1,53 @@
+from sudoku_board import Board
+from guikısıtyayılımı import constraint_propagation
+
+# -----------------------------------------------------------------------------
+# ÖN İŞLEME AŞAMALARI + ARAMA MOTORU BORU HATTI (PIPELINE)
+# -----------------------------------------------------------------------------
+# Bir aşama (stage) Board alıp Board döndüren bir fonksiyondur; çelişki bulursa
+# None döndürür ve boru hattı arama motoruna hiç gitmeden durur. Aşamaların
+# doldurduğu hücreler tahtaya yazıldığı için arama motorları onları verilen
+# (sabit) hücreler gibi görür:
+#   • min_conflict_solve → init_rows bu hücreleri fixed_cells'e katar,
+#   • a_star_sudoku      → başlangıç sezgiseli (boş hücre sayısı), yani
+#                          çözüme kalan derinlik, o kadar azalır.
+
+
+def has_contradiction(board):
+    """Bir birimde tekrar eden rakam varsa ya da adayı kalmamış boş bir hücre
+    varsa True döner; böyle bir tahta çözülemez."""
+
+    if not board.is_consistent():
+        return True
+    return any(board.candidate_mask(r, c) == 0 for r, c in board.empty_cells())
+
+
+def propagation_stage(board):
+    """Kısıt yayılımı aşaması: tek adaylı hücreleri zincirleme doldurur.
+    Tahta çelişkili kalırsa None döndürür."""
+
+    if has_contradiction(board):        # Verilen ipuçları zaten çelişkili
+        return None
+    constraint_propagation(board)        # Board yerinde güncellenir
+    if has_contradiction(board):
+        return None
+    return board
+
+
+def run_pipeline(board, engine, stages=(propagation_stage,), **engine_kwargs):
+    """Önce stages içindeki ön işleme aşamalarını sırayla, ardından arama
+    motorunu (engine) çalıştırır ve motorun sonucunu döndürür.
+
+    board bir Board ya da 9x9 liste olabilir; orijinali değiştirilmez.
+    Bir aşama None döndürürse (çelişki) None döner; aşamalar tahtayı tamamen
+    çözdüyse motor çalıştırılmadan çözüm döner. engine_kwargs motora aynen
+    iletilir (ör. max_iterations)."""
+
+    board = Board(board)                 # Orijinal tahtayı korumak için ucuz kopya
+    for stage in stages:
+        board = stage(board)
+        if board is None:
+            return None                  # Çelişki → erken dur
+        if board.is_solved():
+            return board                 # Arama motoruna gerek kalmadı
+    return engine(board, **engine_kwargs)
@@ -0,0 +1,258 @@
+from array import array
+
+# -----------------------------------------------------------------------------
+# TÜM ÇÖZÜCÜLERİN ORTAK KULLANDIĞI KOMPAKT SUDOKU TAHTASI
+# -----------------------------------------------------------------------------
+# Tahta 81 hücrelik tek bir bytearray içinde satır satır tutulur (hücre = 9*r + c).
+# Her satır, sütun ve 3×3 blok için hangi rakamların bulunduğu bit maskeleriyle
+# (bit v → rakam v var) önbelleğe alınır; böylece geçerlilik kontrolü ve aday
+# hesabı tahtayı taramadan O(1) yapılır.
+
+ALL_DIGITS = 0b1111111110  # 1‑9 rakamlarının bitleri (bit 0 kullanılmaz)
+
+# Hücre indeksinden satır / sütun / blok numarasına hazır tablolar
+ROW_OF = tuple(i // 9 for i in range(81))
+COL_OF = tuple(i % 9 for i in range(81))
+BOX_OF = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+
+# Her hücrenin 20 komşusu (aynı satır, sütun veya blokta bulunan diğer hücreler)
+PEERS = tuple(
+    tuple(j for j in range(81)
+          if j != i and (ROW_OF[j] == ROW_OF[i] or COL_OF[j] == COL_OF[i] or BOX_OF[j] == BOX_OF[i]))
+    for i in range(81)
+)
+
+# Maske → içindeki rakamlar (ör. 0b0000010110 → (1, 2, 4))
+MASK_DIGITS = tuple(tuple(v for v in range(1, 10) if m >> v & 1) for m in range(1 << 10))
+
+
+class Board:
+    """9×9 Sudoku tahtası (0 → boş hücre).
+
+    Hücreler `cells` bytearray'inde, birimlerdeki rakam sayıları `*_count`
+    dizilerinde (indeks = 10*birim + rakam) ve bunların özetleri `*_mask`
+    listelerinde tutulur. Sayaçlar sayesinde min‑conflicts gibi aynı rakamın
+    bir birimde birden fazla bulunmasına izin veren algoritmalar da tahtayı
+    tutarlı biçimde kullanabilir."""
+
+    __slots__ = ("cells", "row_mask", "col_mask", "box_mask",
+                 "row_count", "col_count", "box_count", "empty")
+
+    def __init__(self, rows=None):
+        """rows: 9×9 liste/NumPy dizisi, 81 elemanlı düz dizi ya da başka bir Board.
+        Verilmezse boş tahta oluşturulur."""
+
+        if isinstance(rows, Board):      # Hızlı yol: başka bir tahtanın kopyası
+            rows._copy_into(self)
+            return
+
+        self.cells = bytearray(81)
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        self.row_count = array("B", bytes(90))
+        self.col_count = array("B", bytes(90))
+        self.box_count = array("B", bytes(90))
+        self.empty = 81
+
+        if rows is None:
+            return
+        rows = list(rows)
+        if len(rows) == 9:               # 9×9 biçim → düzleştir
+            values = [int(v) for row in rows for v in row]
+        else:                            # Zaten düz 81 hücre
+            values = [int(v) for v in rows]
+        if len(values) != 81:
+            raise ValueError("Sudoku tahtası 81 hücreden oluşmalıdır")
+        for i, v in enumerate(values):
+            if v:
+                self._place(i, v)
+
+    # --- KOPYALAMA --------------------------------------------------------------
+
+    def _copy_into(self, other):
+        other.cells = bytearray(self.cells)
+        other.row_mask = self.row_mask[:]
+        other.col_mask = self.col_mask[:]
+        other.box_mask = self.box_mask[:]
+        other.row_count = array("B", self.row_count)
+        other.col_count = array("B", self.col_count)
+        other.box_count = array("B", self.box_count)
+        other.empty = self.empty
+
+    def copy(self):
+        """Tahtanın bağımsız bir kopyasını döndürür (copy.deepcopy'den çok daha ucuz)."""
+        new = Board.__new__(Board)
+        self._copy_into(new)
+        return new
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    # --- HÜCRE ERİŞİMİ ----------------------------------------------------------
+
+    def _place(self, i, v):
+        # Boş i hücresine v rakamını yazar ve sayaç/maskeleri günceller.
+        r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+        self.cells[i] = v
+        self.empty -= 1
+        bit = 1 << v
+        self.row_count[10 * r + v] += 1
+        self.col_count[10 * c + v] += 1
+        self.box_count[10 * b + v] += 1
+        self.row_mask[r] |= bit
+        self.col_mask[c] |= bit
+        self.box_mask[b] |= bit
+
+    def _remove(self, i):
+        # Dolu i hücresini boşaltır; rakam birimde başka yerde yoksa maskeden silinir.
+        v = self.cells[i]
+        r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+        self.cells[i] = 0
+        self.empty += 1
+        keep = ~(1 << v)
+        self.row_count[10 * r + v] -= 1
+        if not self.row_count[10 * r + v]:
+            self.row_mask[r] &= keep
+        self.col_count[10 * c + v] -= 1
+        if not self.col_count[10 * c + v]:
+            self.col_mask[c] &= keep
+        self.box_count[10 * b + v] -= 1
+        if not self.box_count[10 * b + v]:
+            self.box_mask[b] &= keep
+
+    def get(self, row, col):
+        return self.cells[9 * row + col]
+
+    def set(self, row, col, num):
+        """<row>,<col> hücresine num yazar (0 → hücreyi boşaltır)."""
+        i = 9 * row + col
+        if self.cells[i]:
+            self._remove(i)
+        if num:
+            self._place(i, num)
+
+    def __getitem__(self, key):
+        row, col = key
+        return self.cells[9 * row + col]
+
+    def __setitem__(self, key, num):
+        row, col = key
+        self.set(row, col, num)
+
+    def swap(self, row, col1, col2):
+        """Aynı satırdaki iki hücrenin değerlerini yer değiştirir."""
+        a, b = self.get(row, col1), self.get(row, col2)
+        self.set(row, col1, b)
+        self.set(row, col2, a)
+
+    # --- KOPYASIZ GÖRÜNÜMLER ----------------------------------------------------
+
+    def row_view(self, row):
+        """Satırın salt okunur, kopyasız görünümü (memoryview)."""
+        return memoryview(self.cells)[9 * row:9 * row + 9].toreadonly()
+
+    def col_view(self, col):
+        """Sütunun salt okunur, kopyasız görünümü (adımlı memoryview)."""
+        return memoryview(self.cells)[col::9].toreadonly()
+
+    def box_values(self, box):
+        """3×3 bloktaki değerler (blok bellekte bitişik olmadığından demet döner)."""
+        start = (box // 3) * 27 + (box % 3) * 3
+        cells = self.cells
+        return tuple(cells[start + 9 * k + j] for k in range(3) for j in range(3))
+
+    def rows(self):
+        """Satırları sırayla kopyasız görünümler olarak üretir."""
+        view = memoryview(self.cells).toreadonly()
+        for r in range(9):
+            yield view[9 * r:9 * r + 9]
+
+    __iter__ = rows
+
+    def to_rows(self):
+        """Eski arayüzlerle uyum için tahtayı liste listesi olarak döndürür."""
+        return [list(self.cells[9 * r:9 * r + 9]) for r in range(9)]
+
+    # --- KISIT SORGULARI --------------------------------------------------------
+
+    def is_valid(self, row, col, num):
+        """num rakamı <row>,<col> hücresinin satır, sütun veya bloğunda yoksa True
+        döner. Önbellekteki maskeler sayesinde O(1)'dir."""
+        used = self.row_mask[row] | self.col_mask[col] | self.box_mask[3 * (row // 3) + col // 3]
+        return not used >> num & 1
+
+    def candidate_mask(self, row, col):
+        """Hücreye yazılabilecek rakamların bit maskesi."""
+        used = self.row_mask[row] | self.col_mask[col] | self.box_mask[3 * (row // 3) + col // 3]
+        return ALL_DIGITS & ~used
+
+    def candidates(self, row, col):
+        """Hücreye yazılabilecek rakamlar kümesi."""
+        return set(MASK_DIGITS[self.candidate_mask(row, col)])
+
+    def conflicts(self, row, col, num):
+        """<row>,<col> hücresine num yazıldığında hücrenin kendisi hariç aynı satır,
+        sütun ve bloktaki num tekrarlarının sayısı."""
+        i = 9 * row + col
+        total = (self.row_count[10 * row + num] + self.col_count[10 * col + num]
+                 + self.box_count[10 * BOX_OF[i] + num])
+        if self.cells[i] == num:         # Hücrenin kendisi her üç birimde de sayıldı
+            total -= 3
+        return total
+
+    def first_empty(self):
+        """İlk boş hücrenin (row, col) konumu; tahta doluysa None."""
+        i = self.cells.find(0)
+        return None if i < 0 else divmod(i, 9)
+
+    def empty_cells(self):
+        """Boş hücrelerin (row, col) listesi."""
+        return [divmod(i, 9) for i, v in enumerate(self.cells) if v == 0]
+
+    def is_consistent(self):
+        """Hiçbir satır, sütun veya blokta aynı rakam birden fazla yoksa True."""
+        return max(self.row_count) <= 1 and max(self.col_count) <= 1 and max(self.box_count) <= 1
+
+    def is_solved(self):
+        """Tahta tamamen dolu ve her birim 1‑9'u tam olarak içeriyorsa True."""
+        if self.empty:
+            return False
+        return all(m == ALL_DIGITS for m in self.row_mask) and \
+            all(m == ALL_DIGITS for m in self.col_mask) and \
+            all(m == ALL_DIGITS for m in self.box_mask)
+
+    # --- KARŞILAŞTIRMA VE YAZDIRMA ----------------------------------------------
+
+    def __eq__(self, other):
+        return isinstance(other, Board) and self.cells == other.cells
+
+    def __lt__(self, other):
+        # heapq'da eşit (f, g) değerli düğümler tahtaya göre sıralanabilsin diye
+        return self.cells < other.cells
+
+    # Tahta değiştirilebilir olduğundan (list gibi) hash'lenemez.
+    __hash__ = None
+
+    def __repr__(self):
+        return "Board(%r)" % bytes(self.cells)
+
+    def to_string(self, unsolved_marker="."):
+        """Tahtayı 3×3 blok ayırıcılarıyla ASCII metne çevirir.
+        unsolved_marker boş hücrelerde gösterilecek karakterdir."""
+        lines = []
+        for i in range(9):
+            if i % 3 == 0 and i != 0:
+                lines.append("-" * 21)   # Her 3 satırda bir ayırıcı çizgi
+            line = ""
+            for j in range(9):
+                if j % 3 == 0 and j != 0:
+                    line += "| "        # Her 3 sütunda bir dikey ayırıcı
+                val = self.cells[9 * i + j]
+                line += (str(val) if val != 0 else unsolved_marker) + " "
+            lines.append(line)
+        return "\n".join(lines)
+
+    __str__ = to_string